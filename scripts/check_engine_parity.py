@@ -0,0 +1,116 @@
+"""Check that the default and Arrow ingest engines store the same rows.
+
+Generates a CSV with duplicate trip_ids (a duplicate can land far from its
+first occurrence, across staging pages and Arrow batches), ingests it with
+each engine into a throwaway schema, and compares counters and table contents
+with each other and with the first occurrence of each trip_id in the CSV.
+
+    python scripts/check_engine_parity.py --db-url "$DATABASE_URL"
+
+Needs pyarrow. Exits non-zero on any mismatch.
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+from dataclasses import asdict
+
+import psycopg
+from psycopg import sql
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import ingest  # noqa: E402
+
+ROWS = 200_000
+DISTINCT_TRIP_IDS = 180_000
+
+
+def _write_csv(path: str, seed: int) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=";", quotechar='"', quoting=csv.QUOTE_ALL)
+        writer.writerow(ingest.EXPECTED_HEADER)
+        for _ in range(ROWS):
+            trip_date = (
+                f"{rng.choice((2023, 2024))}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} "
+                f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+            )
+            writer.writerow(
+                [
+                    f"t{rng.randrange(DISTINCT_TRIP_IDS)}",
+                    f"c{rng.randint(1, 500)}",
+                    f"d{rng.randint(1, 100)}",
+                    trip_date,
+                    rng.choice(("done", "not_respond")),
+                ]
+            )
+
+
+def _first_occurrences(path: str) -> dict[str, tuple]:
+    first: dict[str, tuple] = {}
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=";", quotechar='"')
+        next(reader)
+        for row in reader:
+            result = ingest._row_to_insert_tuple(row)
+            if type(result) is tuple:
+                first.setdefault(result[0], result)
+    return first
+
+
+def _run_engine(db_url: str, engine: str, csv_path: str) -> tuple[dict, dict[str, tuple]]:
+    schema = f"engine_parity_{engine}_{os.getpid()}"
+    with psycopg.connect(db_url, autocommit=True) as admin:
+        admin.execute(sql.SQL("CREATE SCHEMA {};").format(sql.Identifier(schema)))
+    try:
+        with psycopg.connect(db_url, options=f"-c search_path={schema}") as conn:
+            ingest.ensure_base_schema(conn)
+            if engine == "arrow":
+                counters = ingest.ingest_csv_arrow(conn, csv_path)
+            else:
+                counters = ingest.ingest_csv(conn, csv_path)
+            with conn.cursor() as cur:
+                cur.execute("SELECT trip_id, client_id, driver_id, trip_date, status FROM trips;")
+                rows = {row[0]: row for row in cur.fetchall()}
+            conn.rollback()
+    finally:
+        with psycopg.connect(db_url, autocommit=True) as admin:
+            admin.execute(sql.SQL("DROP SCHEMA {} CASCADE;").format(sql.Identifier(schema)))
+    return asdict(counters), rows
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--db-url", default=os.getenv("DATABASE_URL"), help="PostgreSQL URL")
+    p.add_argument("--seed", type=int, default=1)
+    args = p.parse_args()
+    if not args.db_url:
+        p.error("Missing --db-url (or set DATABASE_URL env var)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "trips.csv")
+        _write_csv(csv_path, args.seed)
+        expected = _first_occurrences(csv_path)
+        python_counters, python_rows = _run_engine(args.db_url, "python", csv_path)
+        arrow_counters, arrow_rows = _run_engine(args.db_url, "arrow", csv_path)
+
+    ok = True
+    if python_counters != arrow_counters:
+        print(f"Counters differ:\n  python: {python_counters}\n  arrow:  {arrow_counters}")
+        ok = False
+    for engine, rows in (("python", python_rows), ("arrow", arrow_rows)):
+        if rows != expected:
+            wrong = sorted(k for k in expected.keys() | rows.keys() if rows.get(k) != expected.get(k))
+            print(f"{engine}: {len(wrong)} trip_ids differ from first CSV occurrence, e.g. {wrong[:5]}")
+            ok = False
+
+    print(f"{len(expected):,} trips from {ROWS:,} rows: {'OK' if ok else 'MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
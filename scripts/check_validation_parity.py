@@ -0,0 +1,134 @@
+"""Check that the compiled row validation matches the pure-Python one.
+
+src/ingest_fast.pyx re-implements parse_trip_date and _row_to_insert_tuple
+from src/ingest.py by hand; run this after changing either copy:
+
+    python setup.py build_ext --inplace
+    python scripts/check_validation_parity.py
+
+Exits non-zero on any mismatch.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+try:
+    import ingest_fast
+except ImportError:
+    sys.exit("ingest_fast is not built; run: python setup.py build_ext --inplace")
+
+# With ingest_fast blocked, ingest keeps its pure-Python versions.
+sys.modules["ingest_fast"] = None  # type: ignore[assignment]
+import ingest  # noqa: E402
+
+DATE_CASES = [
+    "2024-01-01 10:00:00",
+    "2024-01-01T10:00:00",
+    "2024-01-01 10:00:00.5",
+    "2024-01-01 10:00:00.123456",
+    " 2024-01-01 10:00:00 ",
+    "2024-02-29 10:00:00",
+    "2023-02-29 10:00:00",
+    "1900-02-29 00:00:00",
+    "2000-02-29 00:00:00",
+    "2024-04-31 00:00:00",
+    "2024-13-01 00:00:00",
+    "2024-01-01 24:00:00",
+    "0000-01-01 00:00:00",
+    "0001-01-01 00:00:00",
+    "9999-12-31 23:59:59.999999",
+    "2024-01-01 10:00:00.1234567",
+    "2024-01-01 10:00:00.",
+    "2024-01-01 10:00:00,5",
+    "2024-01-01 10:00",
+    "20240101T100000",
+    "2024-W01-1 12:00:00",
+    "2024-01-01 10:00:00Z",
+    "2024-01-01 12:00:00.1Z",
+    "2024-01-01 12:00:00.123+05",
+    "2024-01-01 12:00:00.1-05",
+    "2024-01-01T12:00+05",
+    "2024-01-01 10:00:00+02:00",
+    "٢٠٢٤-01-01 10:00:00",
+    "",
+    "garbage",
+]
+
+ROW_CASES = [
+    ["t1", "c1", "d1", "2024-01-01 10:00:00", "done"],
+    ("t1", "c1", "d1", "2024-01-01 10:00:00", "not_respond"),
+    [" t1 ", "c1", "d1", "2024-01-01 10:00:00", " done "],
+    ["t1", "c1", "d1", "2024-01-01 10:00:00", "done", "extra"],
+    ["t1", "c1", "d1", "2024-01-01 10:00:00", "bad"],
+    ["t1", "c1", "d1", "2024-01-01 10:00:00", ""],
+    ["t1", "", "d1", "2024-01-01 10:00:00", "done"],
+    ["t1", "c1", "d1", "2024-02-30 10:00:00", "done"],
+    ["t1", "c1", "d1", "garbage", "bad"],
+    ["t1", "c1"],
+    [],
+]
+
+
+def _random_dates(rng: random.Random, n: int) -> list[str]:
+    noise = "0123456789-: T.WZ+x,٢"
+    dates = []
+    for _ in range(n):
+        s = "%04d-%02d-%02d %02d:%02d:%02d" % (
+            rng.randint(0, 9999),
+            rng.randint(0, 14),
+            rng.randint(0, 32),
+            rng.randint(0, 25),
+            rng.randint(0, 61),
+            rng.randint(0, 61),
+        )
+        if rng.random() < 0.3:
+            s += "." + "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 7)))
+        for _ in range(rng.choice((0, 0, 1, 2))):
+            i = rng.randrange(len(s))
+            s = s[:i] + rng.choice(noise) + s[i + 1 :]
+        if rng.random() < 0.05:
+            s += rng.choice(("Z", "+05", "+05:00", "-0130"))
+        dates.append(s)
+    return dates
+
+
+def _outcome(fn, arg):
+    try:
+        return fn(arg)
+    except Exception as e:  # a raise is a mismatch unless both raise alike
+        return type(e)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--random-dates", type=int, default=200_000)
+    p.add_argument("--seed", type=int, default=1)
+    args = p.parse_args()
+
+    dates = DATE_CASES + _random_dates(random.Random(args.seed), args.random_dates)
+    mismatches = 0
+    for date_str in dates:
+        pure = _outcome(ingest.parse_trip_date, date_str)
+        compiled = _outcome(ingest_fast.parse_trip_date, date_str)
+        if pure != compiled:
+            mismatches += 1
+            print(f"parse_trip_date({date_str!r}): pure={pure!r} compiled={compiled!r}")
+
+    rows = ROW_CASES + [["t1", "c1", "d1", d, "done"] for d in dates[: len(DATE_CASES)]]
+    for row in rows:
+        pure = _outcome(ingest._row_to_insert_tuple, row)
+        compiled = _outcome(ingest_fast._row_to_insert_tuple, row)
+        if pure != compiled:
+            mismatches += 1
+            print(f"_row_to_insert_tuple({row!r}): pure={pure!r} compiled={compiled!r}")
+
+    print(f"{len(dates) + len(rows):,} cases: {'OK' if not mismatches else f'{mismatches} MISMATCHES'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,31 @@
+"""Builds the optional compiled ingest hot path (src/ingest_fast.pyx).
+
+Only meant for
+
+    python setup.py build_ext --inplace
+
+which places the extension next to ingest.py, where it is picked up
+automatically. The project itself is not installable with pip; without
+Cython this script builds nothing and ingest.py uses pure-Python validation.
+"""
+
+import sys
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    print("Cython is not installed; skipping the ingest_fast extension", file=sys.stderr)
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("ingest_fast", ["src/ingest_fast.pyx"])],
+        compiler_directives={"language_level": 3},
+    )
+
+setup(
+    name="data-pipeline-ingest-fast",
+    package_dir={"": "src"},
+    ext_modules=ext_modules,
+)
@@ -1,29 +1,50 @@
 import logging
 import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator, Optional
 
-import psycopg
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from psycopg_pool import AsyncConnectionPool
+from redis import asyncio as aioredis
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+POOL_MIN_SIZE = 4
+POOL_MAX_SIZE = 20
+# Fail fast with 503 rather than queueing for the pool's 30s default.
+POOL_TIMEOUT_SECONDS = 5.0
+
+# Must match CACHE_PREFIX in ingest.py, which clears these keys after a load.
+CACHE_PREFIX = "trips"
+DRIVER_STATS_CACHE_SECONDS = 60
+
+# /health waits briefly for a pooled connection and caches success briefly.
+HEALTH_POOL_TIMEOUT_SECONDS = 0.5
+HEALTH_CACHE_SECONDS = 1.0
+
+# Rows per round-trip when streaming client trips from the server-side cursor.
+CLIENT_TRIPS_FETCH_SIZE = 2000
+
+pool: Optional[AsyncConnectionPool] = None
+_health_ok_at = float("-inf")
 
 
 SQL_DRIVER_STATS = """
 SELECT
   driver_id,
-  COUNT(DISTINCT DATE(trip_date)) AS total_days,
-  ROUND(
-    100.0 * SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END) / COUNT(*)
-  )::INT AS success_rate
-FROM trips
-WHERE driver_id = %s
-GROUP BY driver_id;
+  total_days,
+  ROUND(100.0 * done_count / total_count)::INT AS success_rate
+FROM driver_stats
+WHERE driver_id = %s;
 """.strip()
 
 
@@ -49,21 +70,88 @@ def _get_db_url() -> str:
     return db_url
 
 
+def _get_pool() -> AsyncConnectionPool:
+    if pool is None:
+        raise RuntimeError("Connection pool is not initialized")
+    return pool
+
+
+@asynccontextmanager
+async def _cache_lifespan() -> AsyncIterator[None]:
+    redis_url = os.getenv("REDIS_URL", "").strip()
+    if not redis_url:
+        # Per-process cache; entries just expire instead of being cleared by ingest.
+        logger.info("REDIS_URL is not set; using in-memory response cache")
+        FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX)
+        yield
+        return
+
+    redis = aioredis.from_url(redis_url)
+    FastAPICache.init(RedisBackend(redis), prefix=CACHE_PREFIX)
+    try:
+        yield
+    finally:
+        await redis.close()
+
+
+@asynccontextmanager
+async def _pool_lifespan() -> AsyncIterator[None]:
+    global pool
+    try:
+        db_url = _get_db_url()
+    except RuntimeError:
+        # Keep serving so /health can report 503 instead of crash-looping.
+        logger.error("DATABASE_URL is not set; connection pool disabled")
+        yield
+        return
+
+    # open=False + open(wait=False): start even if the DB is briefly down;
+    # the pool keeps retrying in the background.
+    pool = AsyncConnectionPool(
+        conninfo=db_url,
+        min_size=POOL_MIN_SIZE,
+        max_size=POOL_MAX_SIZE,
+        timeout=POOL_TIMEOUT_SECONDS,
+        # prepare_threshold=0: PREPARE on first use, so each pooled connection
+        # parses/plans the hot queries once and reuses the plan afterwards.
+        kwargs={"autocommit": True, "prepare_threshold": 0},
+        check=AsyncConnectionPool.check_connection,
+        open=False,
+    )
+    await pool.open(wait=False)
+    try:
+        yield
+    finally:
+        await pool.close()
+        pool = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with _cache_lifespan():
+        async with _pool_lifespan():
+            yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+
 def _datetime_to_str(dt: datetime) -> str:
     # Spec does not mandate a trip_date string format; prefer dataset-style for safety.
     # Format: YYYY-MM-DD HH:MM:SS.fff (milliseconds)
-    return dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    # isoformat is C-level formatting; trip_date is TIMESTAMP, so dt is naive.
+    return dt.isoformat(sep=" ", timespec="milliseconds")
 
 
 @app.get("/drivers/{driver_id}/stats")
-def get_driver_stats(driver_id: str) -> dict[str, Any]:
+@cache(expire=DRIVER_STATS_CACHE_SECONDS)
+async def get_driver_stats(driver_id: str) -> dict[str, Any]:
     logger.info("GET /drivers/%s/stats", driver_id)
     try:
-        db_url = _get_db_url()
-        with psycopg.connect(db_url) as conn:
-            with conn.cursor() as cur:
-                cur.execute(SQL_DRIVER_STATS, (driver_id,))
-                row = cur.fetchone()
+        async with _get_pool().connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(SQL_DRIVER_STATS, (driver_id,))
+                row = await cur.fetchone()
     except HTTPException:
         raise
     except Exception:
@@ -81,45 +169,48 @@ def get_driver_stats(driver_id: str) -> dict[str, Any]:
 
 
 @app.get("/clients/{client_id}/trips")
-def get_client_trips(client_id: str) -> list[dict[str, Any]]:
+async def get_client_trips(client_id: str) -> list[dict[str, Any]]:
     logger.info("GET /clients/%s/trips", client_id)
+    trips: list[dict[str, Any]] = []
     try:
-        db_url = _get_db_url()
-        with psycopg.connect(db_url) as conn:
-            with conn.cursor() as cur:
-                cur.execute(SQL_CLIENT_TRIPS, (client_id,))
-                rows = cur.fetchall()
+        async with _get_pool().connection() as conn:
+            # Server-side cursors need a transaction; pooled connections autocommit.
+            async with conn.transaction():
+                async with conn.cursor(name="trips_stream") as cur:
+                    cur.itersize = CLIENT_TRIPS_FETCH_SIZE
+                    await cur.execute(SQL_CLIENT_TRIPS, (client_id,))
+                    async for trip_id, driver_id, trip_date, status in cur:
+                        trips.append(
+                            {
+                                "trip_id": trip_id,
+                                "driver_id": driver_id,
+                                "trip_date": _datetime_to_str(trip_date),
+                                "status": status,
+                            }
+                        )
     except HTTPException:
         raise
     except Exception:
         logger.exception("DB error while fetching client trips")
         raise HTTPException(status_code=503, detail="db_unreachable")
 
-    if not rows:
+    if not trips:
         raise HTTPException(status_code=404, detail="client_not_found")
 
-    trips: list[dict[str, Any]] = []
-    for trip_id, driver_id, trip_date, status in rows:
-        trips.append(
-            {
-                "trip_id": str(trip_id),
-                "driver_id": str(driver_id),
-                "trip_date": _datetime_to_str(trip_date),
-                "status": str(status),
-            }
-        )
     return trips
 
 
 @app.get("/health")
-def health() -> Any:
+async def health() -> Any:
+    global _health_ok_at
     logger.info("GET /health")
+    # Frequent probes within the window reuse the last successful check.
+    if time.monotonic() - _health_ok_at < HEALTH_CACHE_SECONDS:
+        return {"status": "ok"}
     try:
-        db_url = _get_db_url()
-        with psycopg.connect(db_url) as conn:
-            with conn.cursor() as cur:
-                cur.execute(SQL_HEALTH)
-                cur.fetchone()
+        async with _get_pool().connection(timeout=HEALTH_POOL_TIMEOUT_SECONDS) as conn:
+            await conn.execute(SQL_HEALTH)
+        _health_ok_at = time.monotonic()
         return {"status": "ok"}
     except Exception:
         return JSONResponse(status_code=503, content={"status": "db_unreachable"})
@@ -1,22 +1,67 @@
 import argparse
 import csv
+import functools
 import logging
 import os
+import queue
+import struct
+import threading
 import time
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Iterable, Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional, Union
 
 import psycopg
+import redis
+from psycopg import sql
 
 
 EXPECTED_HEADER = ["trip_id", "client_id", "driver_id", "trip_date", "status"]
 ALLOWED_STATUS = {"done", "not_respond"}
 
+# _row_to_insert_tuple reject codes.
+_INVALID_DATE = 1
+_INVALID_STATUS = 2
+_OTHER_ERROR = 3
+
 DEFAULT_CSV_PATH = "output.csv"
 BATCH_SIZE = 1000
+# Commit every 100k rows: bounds work lost on failure without a commit per batch.
+COMMIT_EVERY_N_BATCHES = 100
+# Parsed batches buffered between the CSV reader and the DB writer thread.
+INGEST_QUEUE_SIZE = 4
 LOG_EVERY_N_ROWS = 50_000
 
+# Files above this size are read with a larger buffer and sequential readahead.
+LARGE_CSV_BYTES = 256 << 20
+LARGE_CSV_BUFFER_SIZE = 8 << 20
+
+# Binary COPY framing: signature + flags + header extension length, then
+# per row a field count and length-prefixed values; -1 field count ends it.
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + b"\x00\x00\x00\x00" + b"\x00\x00\x00\x00"
+_COPY_BINARY_TRAILER = struct.pack(">h", -1)
+_COPY_BINARY_FIELD_COUNT = struct.pack(">h", 5)
+_pack_field_len = struct.Struct(">i").pack
+_pack_timestamp_field = struct.Struct(">iq").pack
+# Binary timestamps are int64 microseconds since 2000-01-01.
+_PG_EPOCH = datetime(2000, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Fresh loads (trips at most this large) skip index maintenance and WAL.
+BULK_LOAD_MAX_EXISTING_ROWS = 100_000
+_SECONDARY_INDEXES = (
+    "idx_trips_driver_date",
+    "idx_trips_client_date",
+)
+
+# Arrow engine: bytes per parsed record batch; each batch is one COPY.
+ARROW_BLOCK_SIZE = 8 << 20
+_ARROW_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_ARROW_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d{1,6})?$"
+
+# Must match CACHE_PREFIX in api.py.
+CACHE_PREFIX = "trips"
+
 
 @dataclass
 class Counters:
@@ -39,39 +84,69 @@ class Counters:
 
 def parse_trip_date(date_str: str) -> Optional[datetime]:
     s = date_str.strip()
-    if not s:
-        return None
 
-    try:
-        return datetime.fromisoformat(s.replace(" ", "T"))
-    except ValueError:
-        pass
-
-    try:
-        return datetime.strptime(s, "%Y-%m-%d %H:%M:%S.%f")
-    except ValueError:
-        pass
+    # Dataset shape: YYYY-MM-DD[ T]HH:MM:SS with an optional .f{1,6} fraction.
+    # Reject other shapes up front instead of raising/catching ValueError;
+    # fromisoformat alone would also take ISO week dates, UTC offsets and
+    # non-ASCII digits.
+    n = len(s)
+    if n != 19 and not (21 <= n <= 26 and s[19] == "."):
+        return None
+    if s[10] != " " and s[10] != "T":
+        return None
+    if s[4] != "-" or s[7] != "-" or s[13] != ":" or s[16] != ":" or not s.isascii():
+        return None
 
+    # Python 3.11+ fromisoformat accepts the space separator and 1-6 digit fractions.
     try:
-        return datetime.strptime(s, "%Y-%m-%d %H:%M:%S")
+        dt = datetime.fromisoformat(s)
     except ValueError:
         return None
+    # An offset can still hide in the fraction ("...:00.1Z"); trip_date is
+    # TIMESTAMP, and aware datetimes cannot be encoded for it.
+    if dt.tzinfo is not None:
+        return None
+    return dt
 
 
-def ensure_schema(conn: psycopg.Connection) -> None:
+def ensure_base_schema(conn: psycopg.Connection) -> None:
     logging.info("Ensuring schema exists")
     with conn.cursor() as cur:
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS trips (
-              trip_id TEXT PRIMARY KEY,
+              trip_id TEXT NOT NULL,
               client_id TEXT NOT NULL,
               driver_id TEXT NOT NULL,
               trip_date TIMESTAMP NOT NULL,
-              status TEXT NOT NULL CHECK (status IN ('done','not_respond'))
-            );
+              status TEXT NOT NULL CHECK (status IN ('done','not_respond')),
+              PRIMARY KEY (trip_id, trip_date)
+            ) PARTITION BY RANGE (trip_date);
             """
         )
+    _ensure_trip_ids(conn)
+    _ensure_driver_stats(conn)
+    conn.commit()
+
+
+def _ensure_trip_ids(conn: psycopg.Connection) -> None:
+    # The partitioned PK must include trip_date, so trip_id uniqueness across
+    # partitions is enforced here; _merge_stage claims ids before inserting.
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass('trip_ids') IS NULL;")
+        row = cur.fetchone()
+        needs_backfill = bool(row and row[0])
+
+        cur.execute("CREATE TABLE IF NOT EXISTS trip_ids (trip_id TEXT PRIMARY KEY);")
+
+        if needs_backfill:
+            logging.info("Backfilling trip_ids from existing trips")
+            cur.execute("INSERT INTO trip_ids (trip_id) SELECT DISTINCT trip_id FROM trips;")
+
+
+def ensure_indexes(conn: psycopg.Connection) -> None:
+    logging.info("Ensuring indexes exist")
+    with conn.cursor() as cur:
         cur.execute(
             "CREATE INDEX IF NOT EXISTS idx_trips_driver_date ON trips(driver_id, trip_date);"
         )
@@ -81,6 +156,294 @@ def ensure_schema(conn: psycopg.Connection) -> None:
     conn.commit()
 
 
+def _begin_bulk_load(conn: psycopg.Connection) -> bool:
+    """Prepare a near-empty database for a fast initial load.
+
+    Drops the secondary indexes (rebuilt by ensure_indexes afterwards) and
+    marks the written tables UNLOGGED. Both are skipped for incremental loads,
+    where rebuilding indexes and rewriting the table would cost more than
+    they save. Returns whether bulk-load mode was entered.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT count(*) FROM (SELECT 1 FROM trips LIMIT %s) t;",
+            (BULK_LOAD_MAX_EXISTING_ROWS + 1,),
+        )
+        row = cur.fetchone()
+        if row is None or row[0] > BULK_LOAD_MAX_EXISTING_ROWS:
+            # A bulk load killed before _end_bulk_load leaves tables UNLOGGED,
+            # and later (larger) loads would never restore them otherwise.
+            if _set_tables_logged(cur):
+                logging.warning("Restored tables left UNLOGGED by an interrupted bulk load")
+            conn.commit()
+            return False
+
+        logging.info("Bulk load: dropping secondary indexes, setting tables UNLOGGED")
+        for index_name in _SECONDARY_INDEXES:
+            cur.execute(f"DROP INDEX IF EXISTS {index_name};")
+        for table_name in _bulk_load_tables(cur):
+            cur.execute(sql.SQL("ALTER TABLE {} SET UNLOGGED;").format(sql.Identifier(table_name)))
+    conn.commit()
+    return True
+
+
+def _end_bulk_load(conn: psycopg.Connection) -> None:
+    logging.info("Bulk load: setting tables LOGGED")
+    with conn.cursor() as cur:
+        _set_tables_logged(cur)
+    conn.commit()
+
+
+def _set_tables_logged(cur: psycopg.Cursor) -> list[str]:
+    """SET LOGGED on any UNLOGGED bulk-load table; returns the tables changed."""
+    cur.execute(
+        """
+        SELECT relid::regclass::text
+        FROM pg_partition_tree('trips') p
+        JOIN pg_class c ON c.oid = p.relid
+        WHERE p.isleaf AND c.relpersistence = 'u'
+        UNION ALL
+        SELECT oid::regclass::text
+        FROM pg_class
+        WHERE oid IN ('trip_ids'::regclass, 'driver_days'::regclass, 'driver_stats'::regclass)
+          AND relpersistence = 'u';
+        """
+    )
+    table_names = [row[0] for row in cur.fetchall()]
+    for table_name in table_names:
+        cur.execute(sql.SQL("ALTER TABLE {} SET LOGGED;").format(sql.Identifier(table_name)))
+    return table_names
+
+
+def _bulk_load_tables(cur: psycopg.Cursor) -> list[str]:
+    # SET [UN]LOGGED is a no-op on a partitioned table, so target its leaf
+    # partitions (for an unpartitioned trips, that is trips itself).
+    cur.execute("SELECT relid::regclass::text FROM pg_partition_tree('trips') WHERE isleaf;")
+    return [row[0] for row in cur.fetchall()] + ["trip_ids", "driver_days", "driver_stats"]
+
+
+def _trips_is_partitioned(conn: psycopg.Connection) -> bool:
+    # Databases created before partitioning keep their plain trips table.
+    with conn.cursor() as cur:
+        cur.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = 'trips'::regclass;")
+        row = cur.fetchone()
+    return bool(row and row[0])
+
+
+@dataclass
+class _TripPartitions:
+    """Monthly trips partitions, created on demand as ingest sees new months."""
+
+    enabled: bool
+    unlogged: bool = False
+    known: set[str] = field(default_factory=set)
+
+    def ensure(self, conn: psycopg.Connection, months: Iterable[str]) -> None:
+        """Create partitions for the given "YYYY-MM" months if missing."""
+        if not self.enabled:
+            return
+        missing = sorted(set(months) - self.known)
+        if not missing:
+            return
+
+        created = False
+        with conn.cursor() as cur:
+            for month in missing:
+                name = f"trips_y{month[:4]}m{month[5:7]}"
+                cur.execute("SELECT to_regclass(%s) IS NULL;", (name,))
+                row = cur.fetchone()
+                if row and row[0]:
+                    start = date(int(month[:4]), int(month[5:7]), 1)
+                    if start.year == date.max.year and start.month == 12:
+                        # No year 10000 for the bound (e.g. 9999-12-31 sentinel dates).
+                        end = sql.SQL("MAXVALUE")
+                    else:
+                        end = sql.Literal(
+                            date(start.year + start.month // 12, start.month % 12 + 1, 1)
+                        )
+                    cur.execute(
+                        sql.SQL(
+                            "CREATE {} TABLE IF NOT EXISTS {} PARTITION OF trips "
+                            "FOR VALUES FROM ({}) TO ({});"
+                        ).format(
+                            sql.SQL("UNLOGGED" if self.unlogged else ""),
+                            sql.Identifier(name),
+                            sql.Literal(start),
+                            end,
+                        )
+                    )
+                    created = True
+                self.known.add(month)
+        if created:
+            # Creating a partition locks trips exclusively; commit right away
+            # rather than blocking API reads until the next periodic commit.
+            conn.commit()
+
+
+def _ensure_driver_stats(conn: psycopg.Connection) -> None:
+    # Rollup read by GET /drivers/{driver_id}/stats, kept in sync by a trigger
+    # on trips so the API does a single-row PK lookup instead of aggregating.
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass('driver_stats') IS NULL;")
+        row = cur.fetchone()
+        needs_backfill = bool(row and row[0])
+
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS driver_days (
+              driver_id TEXT NOT NULL,
+              day DATE NOT NULL,
+              PRIMARY KEY (driver_id, day)
+            );
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS driver_stats (
+              driver_id TEXT PRIMARY KEY,
+              total_days INT NOT NULL,
+              done_count BIGINT NOT NULL,
+              total_count BIGINT NOT NULL
+            );
+            """
+        )
+        cur.execute(
+            """
+            CREATE OR REPLACE FUNCTION trips_rollup_driver_stats() RETURNS trigger AS $$
+            BEGIN
+              WITH new_days AS (
+                INSERT INTO driver_days (driver_id, day)
+                SELECT DISTINCT driver_id, trip_date::date FROM new_trips
+                ON CONFLICT DO NOTHING
+                RETURNING driver_id
+              ),
+              day_counts AS (
+                SELECT driver_id, COUNT(*) AS days FROM new_days GROUP BY driver_id
+              ),
+              trip_counts AS (
+                SELECT
+                  driver_id,
+                  COUNT(*) FILTER (WHERE status = 'done') AS done_count,
+                  COUNT(*) AS total_count
+                FROM new_trips
+                GROUP BY driver_id
+              )
+              INSERT INTO driver_stats (driver_id, total_days, done_count, total_count)
+              SELECT t.driver_id, COALESCE(d.days, 0), t.done_count, t.total_count
+              FROM trip_counts t
+              LEFT JOIN day_counts d USING (driver_id)
+              ON CONFLICT (driver_id) DO UPDATE SET
+                total_days = driver_stats.total_days + EXCLUDED.total_days,
+                done_count = driver_stats.done_count + EXCLUDED.done_count,
+                total_count = driver_stats.total_count + EXCLUDED.total_count;
+              RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            """
+        )
+        # Statement-level with a transition table: one upsert per driver per
+        # INSERT statement, rather than one per inserted row. Per-row updates
+        # pile up row versions on hot drivers inside long ingest transactions.
+        cur.execute(
+            """
+            CREATE OR REPLACE TRIGGER trips_driver_stats
+            AFTER INSERT ON trips
+            REFERENCING NEW TABLE AS new_trips
+            FOR EACH STATEMENT EXECUTE FUNCTION trips_rollup_driver_stats();
+            """
+        )
+
+        if needs_backfill:
+            logging.info("Backfilling driver_stats from existing trips")
+            cur.execute(
+                "INSERT INTO driver_days (driver_id, day) "
+                "SELECT DISTINCT driver_id, trip_date::date FROM trips;"
+            )
+            cur.execute(
+                """
+                INSERT INTO driver_stats (driver_id, total_days, done_count, total_count)
+                SELECT
+                  driver_id,
+                  COUNT(DISTINCT trip_date::date),
+                  COUNT(*) FILTER (WHERE status = 'done'),
+                  COUNT(*)
+                FROM trips
+                GROUP BY driver_id;
+                """
+            )
+
+
+def _prepare_ingest_session(conn: psycopg.Connection) -> None:
+    with conn.cursor() as cur:
+        # Session-scoped staging table: batches are COPY'd here, then merged into
+        # trips so ON CONFLICT can still skip duplicates.
+        # seq numbers rows in COPY order (ctid does not reliably follow it),
+        # so the merge can keep the first occurrence of a duplicate trip_id.
+        cur.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS trips_stage ("
+            "LIKE trips INCLUDING DEFAULTS, seq BIGINT GENERATED ALWAYS AS IDENTITY);"
+        )
+        # The load is re-runnable from the CSV, so a crash losing the last few
+        # commits is acceptable; don't wait for WAL fsync on each commit.
+        cur.execute("SET synchronous_commit = off;")
+    conn.commit()
+
+
+def _merge_stage(cur: psycopg.Cursor) -> int:
+    # The partitioned PK is (trip_id, trip_date), so ON CONFLICT on trips would
+    # admit a trip_id re-sent with a different date. Claim ids in trip_ids
+    # first (one PK index lookup each) and insert only the rows whose id was
+    # new. DISTINCT ON keeps the first occurrence within the batch, as before.
+    cur.execute(
+        """
+        WITH first_rows AS (
+          SELECT DISTINCT ON (trip_id) trip_id, client_id, driver_id, trip_date, status
+          FROM trips_stage
+          ORDER BY trip_id, seq
+        ),
+        new_ids AS (
+          INSERT INTO trip_ids (trip_id)
+          SELECT trip_id FROM first_rows
+          ON CONFLICT DO NOTHING
+          RETURNING trip_id
+        )
+        INSERT INTO trips (trip_id, client_id, driver_id, trip_date, status)
+        SELECT f.trip_id, f.client_id, f.driver_id, f.trip_date, f.status
+        FROM first_rows f
+        JOIN new_ids USING (trip_id)
+        """
+    )
+    inserted = cur.rowcount
+    cur.execute("TRUNCATE trips_stage;")
+    return inserted
+
+
+def _encode_copy_binary(rows: list[tuple[str, str, str, datetime, str]], encoding: str) -> bytes:
+    # Whole batch as one binary COPY stream: no per-cell adapter dispatch in
+    # psycopg and no text parsing (notably of trip_date) on the server.
+    status_fields = {
+        status: _pack_field_len(len(encoded)) + encoded
+        for status, encoded in ((s, s.encode(encoding)) for s in ("done", "not_respond"))
+    }
+    parts = [_COPY_BINARY_HEADER]
+    append = parts.append
+    for trip_id, client_id, driver_id, trip_dt, status in rows:
+        trip_id_b = trip_id.encode(encoding)
+        client_id_b = client_id.encode(encoding)
+        driver_id_b = driver_id.encode(encoding)
+        append(_COPY_BINARY_FIELD_COUNT)
+        append(_pack_field_len(len(trip_id_b)))
+        append(trip_id_b)
+        append(_pack_field_len(len(client_id_b)))
+        append(client_id_b)
+        append(_pack_field_len(len(driver_id_b)))
+        append(driver_id_b)
+        append(_pack_timestamp_field(8, (trip_dt - _PG_EPOCH) // _ONE_MICROSECOND))
+        append(status_fields[status])
+    append(_COPY_BINARY_TRAILER)
+    return b"".join(parts)
+
+
 def _insert_batch(
     conn: psycopg.Connection,
     rows: list[tuple[str, str, str, datetime, str]],
@@ -88,18 +451,15 @@ def _insert_batch(
     if not rows:
         return 0, 0
 
-    sql = (
-        "INSERT INTO trips (trip_id, client_id, driver_id, trip_date, status) "
-        "VALUES (%s, %s, %s, %s, %s) "
-        "ON CONFLICT (trip_id) DO NOTHING"
-    )
-
     with conn.cursor() as cur:
         try:
-            cur.executemany(sql, rows)
-            inserted = cur.rowcount
+            with cur.copy(
+                "COPY trips_stage (trip_id, client_id, driver_id, trip_date, status) "
+                "FROM STDIN WITH (FORMAT BINARY)"
+            ) as copy:
+                copy.write(_encode_copy_binary(rows, conn.info.encoding))
+            inserted = _merge_stage(cur)
             duplicates = len(rows) - inserted
-            conn.commit()
         except Exception:
             conn.rollback()
             raise
@@ -107,77 +467,351 @@ def _insert_batch(
     return inserted, duplicates
 
 
-def _row_to_insert_tuple(row: dict[str, str], counters: Counters) -> Optional[tuple[str, str, str, datetime, str]]:
+def _row_to_insert_tuple(row: list[str]) -> Union[tuple[str, str, str, datetime, str], int]:
+    """Validate one CSV row.
+
+    Returns the insert tuple, or one of the _INVALID_DATE / _INVALID_STATUS /
+    _OTHER_ERROR codes so the caller can count rejects in local variables.
+    """
     try:
-        trip_id = (row.get("trip_id") or "").strip()
-        client_id = (row.get("client_id") or "").strip()
-        driver_id = (row.get("driver_id") or "").strip()
-        trip_date_raw = (row.get("trip_date") or "").strip()
-        status = (row.get("status") or "").strip()
+        # Positional, in EXPECTED_HEADER order. Short rows raise IndexError
+        # and are counted as other errors below.
+        trip_id = row[0].strip()
+        client_id = row[1].strip()
+        driver_id = row[2].strip()
+        trip_date_raw = row[3].strip()
+        # ALLOWED_STATUS spelled out: csv.reader yields fresh strings, so a set
+        # lookup pays for hashing each one; == rejects on length/first byte.
+        status = row[4]
+        if status != "done" and status != "not_respond":
+            status = status.strip()
 
         if not trip_id or not client_id or not driver_id or not trip_date_raw or not status:
-            counters.other_errors += 1
-            return None
+            return _OTHER_ERROR
 
-        if status not in ALLOWED_STATUS:
-            counters.invalid_status += 1
-            return None
+        if status != "done" and status != "not_respond":
+            return _INVALID_STATUS
 
         trip_dt = parse_trip_date(trip_date_raw)
         if trip_dt is None:
-            counters.invalid_date += 1
-            return None
+            return _INVALID_DATE
 
         return (trip_id, client_id, driver_id, trip_dt, status)
     except Exception:
-        counters.other_errors += 1
-        return None
+        return _OTHER_ERROR
+
+
+try:
+    # Compiled drop-ins for the two functions above (src/ingest_fast.pyx,
+    # built via setup.py); the pure-Python versions remain the fallback.
+    from ingest_fast import _row_to_insert_tuple, parse_trip_date  # noqa: F811
+
+    _COMPILED_VALIDATION = True
+except ImportError:
+    _COMPILED_VALIDATION = False
+
+
+def _publish_counts(
+    counters: Counters,
+    rows_read: int,
+    invalid_date: int,
+    invalid_status: int,
+    other_errors: int,
+) -> None:
+    counters.total_rows_read = rows_read
+    counters.invalid_date = invalid_date
+    counters.invalid_status = invalid_status
+    counters.other_errors = other_errors
+
+
+def _log_progress(counters: Counters) -> None:
+    logging.info(
+        "Progress: read=%d inserted=%d dup=%d invalid_date=%d invalid_status=%d other=%d",
+        counters.total_rows_read,
+        counters.inserted,
+        counters.duplicates_skipped,
+        counters.invalid_date,
+        counters.invalid_status,
+        counters.other_errors,
+    )
+
+
+def _advise_sequential_read(fd: int) -> None:
+    # Lets the kernel read ahead more aggressively so buffer refills rarely
+    # block the parser. posix_fadvise is unavailable on e.g. macOS.
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _write_batches(
+    conn: psycopg.Connection,
+    batches: "queue.Queue[Optional[list[tuple[str, str, str, datetime, str]]]]",
+    counters: Counters,
+    partitions: _TripPartitions,
+    errors: list[BaseException],
+    reader_failed: threading.Event,
+) -> None:
+    # Writer thread: owns conn for the duration of the load. The reader thread
+    # never touches inserted/duplicates_skipped, so no lock is needed.
+    uncommitted_batches = 0
+    while True:
+        batch = batches.get()
+        if batch is None:
+            break
+        if errors:
+            # Keep draining so the reader never blocks on a full queue.
+            continue
+        try:
+            months = {(row[3].year, row[3].month) for row in batch}
+            partitions.ensure(conn, [f"{year:04d}-{month:02d}" for year, month in months])
+            inserted, duplicates = _insert_batch(conn, batch)
+            counters.inserted += inserted
+            counters.duplicates_skipped += duplicates
+            uncommitted_batches += 1
+            if uncommitted_batches >= COMMIT_EVERY_N_BATCHES:
+                conn.commit()
+                uncommitted_batches = 0
+        except BaseException as e:
+            errors.append(e)
+
+    if errors:
+        return
+    try:
+        if reader_failed.is_set():
+            # Same outcome as a writer failure: keep only the periodic commits.
+            conn.rollback()
+        else:
+            conn.commit()
+    except BaseException as e:
+        errors.append(e)
 
 
-def ingest_csv(conn: psycopg.Connection, csv_path: str) -> Counters:
+def ingest_csv(conn: psycopg.Connection, csv_path: str, bulk_load: bool = False) -> Counters:
     counters = Counters()
     batch: list[tuple[str, str, str, datetime, str]] = []
 
-    # utf-8-sig is BOM-tolerant while still reading utf-8 content.
-    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f, delimiter=";", quotechar='"')
-        if reader.fieldnames != EXPECTED_HEADER:
-            raise ValueError(
-                f"CSV header mismatch. Expected {EXPECTED_HEADER} but got {reader.fieldnames}"
-            )
+    _prepare_ingest_session(conn)
+    partitions = _TripPartitions(enabled=_trips_is_partitioned(conn), unlogged=bulk_load)
 
-        for row in reader:
-            counters.total_rows_read += 1
+    # Parse/validate on this thread while a writer thread COPYs the previous
+    # batches, so DB round-trips overlap with CSV parsing. A single writer:
+    # concurrent transactions upserting the same driver_stats rows would
+    # block on (and deadlock with) each other.
+    batches: "queue.Queue[Optional[list[tuple[str, str, str, datetime, str]]]]" = queue.Queue(
+        maxsize=INGEST_QUEUE_SIZE
+    )
+    writer_errors: list[BaseException] = []
+    reader_failed = threading.Event()
+    writer = threading.Thread(
+        target=_write_batches,
+        args=(conn, batches, counters, partitions, writer_errors, reader_failed),
+        name="ingest-writer",
+    )
+    writer.start()
 
-            insert_row = _row_to_insert_tuple(row, counters)
-            if insert_row is not None:
-                batch.append(insert_row)
-
-            if len(batch) >= BATCH_SIZE:
-                inserted, duplicates = _insert_batch(conn, batch)
-                counters.inserted += inserted
-                counters.duplicates_skipped += duplicates
-                batch.clear()
-
-            if (
-                counters.total_rows_read % LOG_EVERY_N_ROWS == 0
-                and counters.total_rows_read > 0
-            ):
-                logging.info(
-                    "Progress: read=%d inserted=%d dup=%d invalid_date=%d invalid_status=%d other=%d",
-                    counters.total_rows_read,
-                    counters.inserted,
-                    counters.duplicates_skipped,
-                    counters.invalid_date,
-                    counters.invalid_status,
-                    counters.other_errors,
+    try:
+        large_file = os.path.getsize(csv_path) > LARGE_CSV_BYTES
+        # utf-8-sig is BOM-tolerant while still reading utf-8 content.
+        with open(
+            csv_path,
+            "r",
+            encoding="utf-8-sig",
+            newline="",
+            buffering=LARGE_CSV_BUFFER_SIZE if large_file else -1,
+        ) as f:
+            if large_file:
+                _advise_sequential_read(f.fileno())
+            reader = csv.reader(f, delimiter=";", quotechar='"')
+            header = next(reader, None)
+            if header != EXPECTED_HEADER:
+                raise ValueError(
+                    f"CSV header mismatch. Expected {EXPECTED_HEADER} but got {header}"
                 )
 
-    if batch:
-        inserted, duplicates = _insert_batch(conn, batch)
+            # Per-row tallies live in locals (cheap LOAD/STORE_FAST) and are
+            # published to counters once per batch and at the end.
+            rows_read = invalid_date = invalid_status = other_errors = 0
+
+            for row in reader:
+                if not row:
+                    # Blank line; DictReader skipped these silently.
+                    continue
+                rows_read += 1
+
+                result = _row_to_insert_tuple(row)
+                if type(result) is tuple:
+                    batch.append(result)
+                    if len(batch) >= BATCH_SIZE:
+                        if writer_errors:
+                            break
+                        _publish_counts(counters, rows_read, invalid_date, invalid_status, other_errors)
+                        batches.put(batch)
+                        batch = []
+                elif result == _INVALID_DATE:
+                    invalid_date += 1
+                elif result == _INVALID_STATUS:
+                    invalid_status += 1
+                else:
+                    other_errors += 1
+
+                if rows_read % LOG_EVERY_N_ROWS == 0:
+                    _publish_counts(counters, rows_read, invalid_date, invalid_status, other_errors)
+                    _log_progress(counters)
+
+            _publish_counts(counters, rows_read, invalid_date, invalid_status, other_errors)
+
+        if batch and not writer_errors:
+            batches.put(batch)
+    except BaseException:
+        reader_failed.set()
+        raise
+    finally:
+        batches.put(None)
+        writer.join()
+
+    if writer_errors:
+        raise writer_errors[0]
+
+    return counters
+
+
+def ingest_csv_arrow(conn: psycopg.Connection, csv_path: str, bulk_load: bool = False) -> Counters:
+    """Vectorized variant of ingest_csv using PyArrow (optional dependency).
+
+    Parses and validates whole record batches with Arrow compute kernels and
+    streams the surviving rows to the staging table as CSV-format COPY.
+    Rows Arrow rejects for their field count go through _row_to_insert_tuple
+    instead, so counters match ingest_csv.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pa_csv
+    except ImportError as e:
+        raise RuntimeError("--engine arrow requires pyarrow (pip install pyarrow)") from e
+
+    counters = Counters()
+    malformed_lines: list[str] = []
+
+    def _defer_malformed(row: "pa_csv.InvalidRow") -> str:
+        # Wrong field count: validated row-at-a-time by _ingest_malformed, so
+        # extra trailing fields are ignored and short rows counted as other
+        # errors, as in ingest_csv.
+        malformed_lines.append(row.text)
+        return "skip"
+
+    def _ingest_malformed() -> None:
+        lines = malformed_lines[:]
+        del malformed_lines[: len(lines)]
+        rows = []
+        for fields in csv.reader(lines, delimiter=";", quotechar='"'):
+            if not fields:
+                continue
+            counters.total_rows_read += 1
+            result = _row_to_insert_tuple(fields)
+            if type(result) is tuple:
+                rows.append(result)
+            elif result == _INVALID_DATE:
+                counters.invalid_date += 1
+            elif result == _INVALID_STATUS:
+                counters.invalid_status += 1
+            else:
+                counters.other_errors += 1
+        if not rows:
+            return
+        partitions.ensure(conn, {f"{row[3].year:04d}-{row[3].month:02d}" for row in rows})
+        inserted, duplicates = _insert_batch(conn, rows)
+        conn.commit()
         counters.inserted += inserted
         counters.duplicates_skipped += duplicates
 
+    _prepare_ingest_session(conn)
+    partitions = _TripPartitions(enabled=_trips_is_partitioned(conn), unlogged=bulk_load)
+
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        parse_options=pa_csv.ParseOptions(
+            delimiter=";",
+            quote_char='"',
+            invalid_row_handler=_defer_malformed,
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in EXPECTED_HEADER},
+        ),
+    )
+    if reader.schema.names != EXPECTED_HEADER:
+        raise ValueError(
+            f"CSV header mismatch. Expected {EXPECTED_HEADER} but got {reader.schema.names}"
+        )
+
+    allowed_status = pa.array(sorted(ALLOWED_STATUS))
+    write_options = pa_csv.WriteOptions(include_header=False)
+
+    for batch in reader:
+        columns = [pc.utf8_trim_whitespace(col) for col in batch.columns]
+        trip_date = columns[3]
+
+        present = functools.reduce(
+            pc.and_, [pc.greater(pc.utf8_length(col), 0) for col in columns]
+        )
+        status_ok = pc.is_in(columns[4], value_set=allowed_status)
+
+        # Same shapes parse_trip_date accepts. strptime rolls over impossible
+        # dates (Feb 30 -> Mar 1), so round-trip the seconds part to reject them;
+        # it also takes year 0, which datetime cannot represent.
+        trip_date = pc.replace_substring(trip_date, "T", " ", max_replacements=1)
+        seconds_part = pc.utf8_slice_codeunits(trip_date, 0, 19)
+        parsed = pc.strptime(seconds_part, format=_ARROW_DATE_FORMAT, unit="s", error_is_null=True)
+        date_ok = pc.and_(
+            pc.match_substring_regex(trip_date, _ARROW_DATE_PATTERN),
+            pc.fill_null(
+                pc.and_(
+                    pc.equal(pc.strftime(parsed, format=_ARROW_DATE_FORMAT), seconds_part),
+                    pc.greater_equal(pc.year(parsed), 1),
+                ),
+                False,
+            ),
+        )
+
+        valid = pc.and_(pc.and_(present, status_ok), date_ok)
+        n_valid = pc.sum(valid).as_py() or 0
+        n_other = batch.num_rows - (pc.sum(present).as_py() or 0)
+        n_bad_status = pc.sum(pc.and_(present, pc.invert(status_ok))).as_py() or 0
+
+        counters.total_rows_read += batch.num_rows
+        counters.other_errors += n_other
+        counters.invalid_status += n_bad_status
+        counters.invalid_date += batch.num_rows - n_other - n_bad_status - n_valid
+
+        if n_valid:
+            table = pa.table(
+                [columns[0], columns[1], columns[2], trip_date, columns[4]],
+                names=EXPECTED_HEADER,
+            ).filter(valid)
+            months = pc.unique(pc.utf8_slice_codeunits(table.column("trip_date"), 0, 7))
+            partitions.ensure(conn, months.to_pylist())
+            buf = pa.BufferOutputStream()
+            pa_csv.write_csv(table, buf, write_options)
+            with conn.cursor() as cur:
+                try:
+                    with cur.copy(
+                        "COPY trips_stage (trip_id, client_id, driver_id, trip_date, status) "
+                        "FROM STDIN WITH (FORMAT CSV)"
+                    ) as copy:
+                        copy.write(buf.getvalue())
+                    inserted = _merge_stage(cur)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            counters.inserted += inserted
+            counters.duplicates_skipped += n_valid - inserted
+
+        _ingest_malformed()
+        _log_progress(counters)
+
+    _ingest_malformed()
     return counters
 
 
@@ -193,6 +827,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="PostgreSQL connection URL (or set DATABASE_URL env var)",
     )
+    p.add_argument(
+        "--engine",
+        choices=("python", "arrow"),
+        default="python",
+        help="CSV parser: streaming csv module (default) or vectorized PyArrow (needs pyarrow)",
+    )
+    p.add_argument(
+        "--redis-url",
+        default=None,
+        help="Redis URL of the API response cache to clear (or set REDIS_URL env var)",
+    )
     return p
 
 
@@ -203,6 +848,18 @@ def _resolve_db_url(arg_db_url: Optional[str]) -> str:
     return db_url
 
 
+def _clear_api_cache(redis_url: str) -> None:
+    # Cached responses would otherwise stay stale until their TTL expires.
+    client = redis.Redis.from_url(redis_url)
+    try:
+        keys = list(client.scan_iter(match=f"{CACHE_PREFIX}:*", count=1000))
+        if keys:
+            client.delete(*keys)
+        logging.info("Cleared %d cached API responses", len(keys))
+    finally:
+        client.close()
+
+
 def _print_report(counters: Counters, duration_seconds: float) -> None:
     throughput = (
         (counters.total_rows_read / duration_seconds) if duration_seconds > 0 else 0.0
@@ -237,11 +894,35 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         db_url = _resolve_db_url(args.db_url)
         csv_path = args.csv
 
+        logging.info(
+            "Row validation: %s", "compiled" if _COMPILED_VALIDATION else "pure Python"
+        )
         start = time.perf_counter()
         with psycopg.connect(db_url) as conn:
-            ensure_schema(conn)
-            counters = ingest_csv(conn, csv_path)
+            ensure_base_schema(conn)
+            bulk_load = _begin_bulk_load(conn)
+            try:
+                if args.engine == "arrow":
+                    counters = ingest_csv_arrow(conn, csv_path, bulk_load=bulk_load)
+                else:
+                    counters = ingest_csv(conn, csv_path, bulk_load=bulk_load)
+            finally:
+                # A failed ingest can leave the transaction aborted; start clean
+                # so restoring LOGGED and the indexes doesn't fail in turn.
+                conn.rollback()
+                try:
+                    if bulk_load:
+                        _end_bulk_load(conn)
+                finally:
+                    ensure_indexes(conn)
         duration = time.perf_counter() - start
+
+        redis_url = (args.redis_url or "").strip() or os.getenv("REDIS_URL", "").strip()
+        if redis_url:
+            try:
+                _clear_api_cache(redis_url)
+            except Exception:
+                logging.warning("Failed to clear API response cache", exc_info=True)
         _print_report(counters, duration)
         return 0
     except Exception:
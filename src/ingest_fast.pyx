@@ -0,0 +1,114 @@
+# cython: language_level=3
+"""Compiled drop-ins for the per-row validation in ingest.py.
+
+Build with ``python setup.py build_ext --inplace``; ingest.py imports these
+when the extension is present and keeps its pure-Python versions otherwise.
+Behaviour must stay identical to parse_trip_date and _row_to_insert_tuple
+there for rows of str; scripts/check_validation_parity.py compares the two.
+"""
+
+from cpython.datetime cimport datetime_new, import_datetime
+
+import_datetime()
+
+# Must match the reject codes in ingest.py.
+cdef object INVALID_DATE = 1
+cdef object INVALID_STATUS = 2
+cdef object OTHER_ERROR = 3
+
+
+cdef inline int _digit(Py_UCS4 c):
+    # ASCII digits only ('0' is 48), as fromisoformat requires.
+    if c < 48 or c > 57:
+        return -1
+    return <int>c - 48
+
+
+cdef inline int _number(str s, Py_ssize_t start, Py_ssize_t length):
+    # Value of `length` ASCII digits at s[start:], or -1 if any is not a digit.
+    cdef int value = 0
+    cdef int d
+    cdef Py_ssize_t i
+    for i in range(start, start + length):
+        d = _digit(s[i])
+        if d < 0:
+            return -1
+        value = value * 10 + d
+    return value
+
+
+cdef inline int _days_in_month(int year, int month):
+    if month == 2:
+        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            return 29
+        return 28
+    if month == 4 or month == 6 or month == 9 or month == 11:
+        return 30
+    return 31
+
+
+cdef object _parse_stripped(str s):
+    cdef Py_ssize_t n = len(s)
+    cdef Py_ssize_t i
+    cdef int year, month, day, hour, minute, second, micro
+
+    if n != 19 and not (21 <= n <= 26 and s[19] == u"."):
+        return None
+    if s[10] != u" " and s[10] != u"T":
+        return None
+    if s[4] != u"-" or s[7] != u"-" or s[13] != u":" or s[16] != u":":
+        return None
+
+    year = _number(s, 0, 4)
+    month = _number(s, 5, 2)
+    day = _number(s, 8, 2)
+    hour = _number(s, 11, 2)
+    minute = _number(s, 14, 2)
+    second = _number(s, 17, 2)
+    micro = 0
+    if n > 19:
+        micro = _number(s, 20, n - 20)
+        for i in range(n - 20, 6):
+            micro *= 10
+
+    # _number returns -1 for non-digits, so this also rejects those.
+    if (
+        year < 1 or month < 1 or month > 12 or hour < 0 or hour > 23
+        or minute < 0 or minute > 59 or second < 0 or second > 59 or micro < 0
+    ):
+        return None
+    if day < 1 or day > _days_in_month(year, month):
+        return None
+
+    return datetime_new(year, month, day, hour, minute, second, micro, None)
+
+
+def parse_trip_date(str date_str):
+    return _parse_stripped(date_str.strip())
+
+
+def _row_to_insert_tuple(row):
+    # Untyped: any sequence, as in the pure-Python version.
+    cdef str trip_id, client_id, driver_id, trip_date_raw, status
+    try:
+        trip_id = row[0].strip()
+        client_id = row[1].strip()
+        driver_id = row[2].strip()
+        trip_date_raw = row[3].strip()
+        status = row[4]
+        if status != u"done" and status != u"not_respond":
+            status = status.strip()
+
+        if not trip_id or not client_id or not driver_id or not trip_date_raw or not status:
+            return OTHER_ERROR
+
+        if status != u"done" and status != u"not_respond":
+            return INVALID_STATUS
+
+        trip_dt = _parse_stripped(trip_date_raw)
+        if trip_dt is None:
+            return INVALID_DATE
+
+        return (trip_id, client_id, driver_id, trip_dt, status)
+    except Exception:
+        return OTHER_ERROR